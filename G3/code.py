@@ -14,13 +14,24 @@ Notes:
 """
 
 import os
+import re
 import json
-import time
+import queue
+import atexit
+import shutil
+import hashlib
 import logging
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import certifi
 from dateutil import parser as dateparser
 
@@ -30,13 +41,19 @@ from selenium.webdriver.support.select import Select
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
-    TimeoutException, NoSuchElementException, ElementClickInterceptedException
+    TimeoutException, ElementClickInterceptedException,
+    StaleElementReferenceException
 )
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s: %(message)s")
 
 # ---------- CONFIG ----------
@@ -46,9 +63,15 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 HEADLESS = True               # set False to see browser while debugging
 PAGE_LOAD_TIMEOUT = 60
-IMPLICIT_WAIT = 3
+IMPLICIT_WAIT = 0             # rely on explicit waits; implicit waits compound with WebDriverWait
 REQUESTS_VERIFY = False       # keep requests verify disabled as you had
 MAX_PAGES = 20                # Maximum pages to scrape per subcourt
+DETAIL_WORKERS = 16           # concurrent HTTP fetchers for case detail pages
+CACHE_DIR = "detail_cache"    # on-disk HTML cache for detail pages, keyed by URL hash
+DRIVER_POOL_SIZE = 4          # pre-warmed Chrome instances; major courts are scraped in parallel
+SUBCOURT_WORKERS = 4          # concurrent subcourt pagination/detail workers within a court
+REUSE_DRIVER_SESSION = False  # attach to the Chrome recorded in DRIVER_SESSION_FILE and keep it alive
+DRIVER_SESSION_FILE = "driver.json"
 
 # Court selection configuration
 # Set to None to scrape all courts, or provide a list of court names to scrape specific ones
@@ -67,15 +90,87 @@ COURT_NAMES = {
     'lar': 'Larkana',
     'search-result_CasesSearch_CIRCUITCODE__13': 'Mirpurkhas'
 }
+
+# lowercase views of SELECTED_COURTS, computed once so the per-court filter
+# does a set lookup for exact matches and lowercases nothing per call
+_SELECTED_LOWER = tuple(s.lower() for s in SELECTED_COURTS) if SELECTED_COURTS else None
+_SELECTED_SET = frozenset(_SELECTED_LOWER) if _SELECTED_LOWER else None
 # ----------------------------
 
-# create a requests session (for downloading any PDFs or fallback GETs)
-req_session = requests.Session()
-req_session.verify = REQUESTS_VERIFY
-req_session.headers.update({
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                  "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140 Safari/537.36"
-})
+# Selector alternatives for the detail-page heuristics, hoisted to module
+# scope. Each group is in priority order (specific selectors before bare
+# fallbacks like ".last-hearing" or ".remarks"), so they must be tried in
+# sequence — comma-joining would replace priority with document order and
+# e.g. return the whole hearing block for "hearing_date".
+DETAIL_SELECTORS = {
+    "summary": ("div#Summary", ".summary", "p.summary", ".case-summary", "#divSummary"),
+    "tagline": (".tagline", "span.tagline", "p.tagline", "#Tagline"),
+    "hearing_date": (".last-hearing .date", ".last-hearing", ".hearing-date", "li.hearing-date"),
+    "hearing_list": (".last-hearing .list", ".hearing-list"),
+    "hearing_stage": (".last-hearing .stage", ".hearing-stage"),
+    "hearing_bench": (".last-hearing .bench", ".hearing-bench"),
+    "hearing_remarks": (".last-hearing .remarks", ".remarks"),
+}
+
+# Profile field labels, normalized lowercase -> output key. Collected in a
+# single pass over the document's text nodes.
+PROFILE_LABELS = {
+    "case id": "case_id",
+    "institution date": "institution_date",
+    "disposal date": "disposal_date",
+    "disposal bench": "disposal_bench",
+    "nature of disposal": "nature_of_disposal",
+}
+
+# PDF-link classification keywords, hoisted so the detail-page anchor loop
+# does set-style membership tests instead of rebuilding literals per anchor.
+PDF_MEMO_KEYS = ("memo", "petition")
+PDF_ORDER_KEYS = ("judgement", "judgment", "order")
+
+def make_session():
+    """
+    Build a requests session for pagination/detail GETs. Each court worker
+    gets its own session: the courts run on separate Chrome drivers with
+    separate cookies, and RequestsCookieJar is not safe to mutate from one
+    thread while another iterates it.
+    """
+    s = requests.Session()
+    s.verify = REQUESTS_VERIFY
+    s.headers.update({
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                      "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140 Safari/537.36",
+        "Connection": "keep-alive",
+        "Accept-Encoding": "gzip, deflate",
+    })
+    # Enlarge the urllib3 pool so the concurrent detail fetchers reuse TCP+TLS
+    # connections instead of reconnecting per request, and retry transient
+    # throttling/5xx responses.
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+
+# per-driver profile/cache temp dirs; /dev/shm is RAM-backed, so leaking
+# them across runs would slowly eat memory. Dirs in the persistent set
+# belong to a Chrome that outlives this process (REUSE_DRIVER_SESSION) and
+# must not be deleted out from under it.
+_TEMP_PROFILE_DIRS = []
+_PERSISTENT_PROFILE_DIRS = set()
+
+
+def _cleanup_temp_profiles():
+    for d in _TEMP_PROFILE_DIRS:
+        if d in _PERSISTENT_PROFILE_DIRS:
+            continue
+        shutil.rmtree(d, ignore_errors=True)
+
+
+atexit.register(_cleanup_temp_profiles)
 
 
 def start_driver(headless: bool = True):
@@ -83,34 +178,198 @@ def start_driver(headless: bool = True):
     if headless:
         # new headless mode for modern Chrome; if issues, set headless=False while debugging
         options.add_argument("--headless=new")
+    # return from driver.get() on DOMContentLoaded instead of waiting for
+    # every subresource; the explicit waits cover actual readiness
+    options.page_load_strategy = "eager"
     options.add_argument("--disable-gpu")
     options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--window-size=1920,1080")
+    # keep the throwaway profile and disk cache on tmpfs where available so
+    # cookie/localStorage writes between navigations never hit the disk;
+    # both dirs are removed by the atexit cleanup
+    shm = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    profile_dir = tempfile.mkdtemp(prefix="shc_profile_", dir=shm)
+    cache_dir = tempfile.mkdtemp(prefix="shc_cache_", dir=shm)
+    _TEMP_PROFILE_DIRS.extend((profile_dir, cache_dir))
+    options.add_argument(f"--user-data-dir={profile_dir}")
+    options.add_argument(f"--disk-cache-dir={cache_dir}")
     # TLS / cert options to suppress handshake failures in Chromium used by Selenium
     options.add_argument("--ignore-certificate-errors")
     options.add_argument("--allow-insecure-localhost")
     options.set_capability("acceptInsecureCerts", True)
     # reduce noisy logs
     options.add_experimental_option("excludeSwitches", ["enable-logging"])
+    # the scraper only reads table/div text, so skip images and stylesheets
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+    })
     from selenium.webdriver.chrome.service import Service
     service = Service(ChromeDriverManager().install())
     driver = webdriver.Chrome(service=service, options=options)
+    # block heavy/no-value resources at the network layer as well
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": [
+            "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp",
+            "*.woff*", "*.ttf", "*.css", "*.mp4",
+            "*google-analytics*", "*doubleclick*",
+        ]})
+    except Exception as e:
+        logging.debug(f"CDP resource blocking unavailable: {e}")
     driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    # Implicit wait stays 0 so the speculative find_element probes
+    # (pagination .next, #btnSearch fallback, #ddlCourt fallback) fail fast
+    # instead of polling for 3 s each time the element is absent.
     driver.implicitly_wait(IMPLICIT_WAIT)
+    # remember which temp dirs back this driver so main() can exempt the
+    # persistent driver's dirs from the atexit cleanup
+    driver._temp_dirs = (profile_dir, cache_dir)
     return driver
 
 
+def absolutize(href):
+    """
+    Cheap absolute-URL join against BASE_URL: skip the full urljoin parse
+    for the common already-absolute and root-relative cases.
+    """
+    if href.startswith("http"):
+        return href
+    if href.startswith("/"):
+        return BASE_URL.rstrip("/") + href
+    return urljoin(BASE_URL, href)
+
+
+def wait_document_ready(driver, timeout=10):
+    """Block until document.readyState == 'complete' (no-op on timeout)."""
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+    except TimeoutException:
+        pass
+
+
+def wait_ajax_settled(driver, timeout=8):
+    """
+    Wait for any loading spinner to disappear after an AJAX-triggering
+    action. Vacuously true on pages without spinner elements, so callers
+    that need proof the results re-rendered must also use
+    wait_results_changed.
+    """
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.invisibility_of_element_located((By.CSS_SELECTOR, ".loading, .spinner"))
+        )
+    except TimeoutException:
+        pass
+
+
+def first_result_row_text(driver):
+    """Text of the first result row, or None when no results are rendered."""
+    rows = driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
+    try:
+        return rows[0].text if rows else None
+    except StaleElementReferenceException:
+        return None
+
+
+def wait_results_changed(driver, old_first, timeout=10):
+    """
+    Wait until the first result row differs from `old_first`. A bare
+    presence wait is satisfied instantly by the previous search's table
+    still sitting in the DOM; this is the actual re-render signal.
+    Returns False on timeout.
+    """
+    def _changed(d):
+        try:
+            return first_result_row_text(d) != old_first
+        except StaleElementReferenceException:
+            return True
+
+    try:
+        WebDriverWait(driver, timeout).until(_changed)
+        return True
+    except TimeoutException:
+        return False
+
+
+def save_driver_session(driver):
+    """Persist the driver's executor URL + session id so later runs can attach."""
+    try:
+        with open(DRIVER_SESSION_FILE, "w", encoding="utf-8") as f:
+            json.dump({"url": driver.command_executor._url, "session_id": driver.session_id}, f)
+    except Exception as e:
+        logging.debug(f"Could not save driver session: {e}")
+
+
+def attach_driver():
+    """
+    Attach to a previously launched Chrome recorded in DRIVER_SESSION_FILE,
+    skipping the ~3 s cold start on repeat runs. Returns None if there is
+    no saved session or it is no longer alive.
+    """
+    if not os.path.exists(DRIVER_SESSION_FILE):
+        return None
+    try:
+        with open(DRIVER_SESSION_FILE, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+
+        # Suppress the newSession handshake so Remote() adopts the saved
+        # session instead of launching (and leaking) a fresh Chrome.
+        from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+        original_execute = RemoteWebDriver.execute
+
+        def _execute_reuse_session(self, driver_command, params=None):
+            if driver_command == "newSession":
+                return {"value": {"sessionId": saved["session_id"], "capabilities": {}}}
+            return original_execute(self, driver_command, params)
+
+        RemoteWebDriver.execute = _execute_reuse_session
+        try:
+            driver = webdriver.Remote(command_executor=saved["url"], options=webdriver.ChromeOptions())
+        finally:
+            RemoteWebDriver.execute = original_execute
+
+        driver.current_url  # probe; raises if the saved session is dead
+        driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+        driver.implicitly_wait(IMPLICIT_WAIT)
+        logging.info("Attached to existing Chrome session.")
+        return driver
+    except Exception as e:
+        logging.info(f"Could not attach to saved driver session ({e}); starting fresh.")
+        return None
+
+
+# the site emits a small set of fixed date formats; strptime is far
+# cheaper than dateutil's reflective parser for these
+_FAST_DATE_FORMATS = ("%d-%m-%Y", "%d/%m/%Y", "%d-%b-%Y", "%Y-%m-%d")
+
+
+@lru_cache(maxsize=8192)
+def _parse_date_cached(s):
+    # hearing/institution dates repeat heavily across cases, so cache the
+    # parse per unique string
+    for fmt in _FAST_DATE_FORMATS:
+        try:
+            return datetime.strptime(s, fmt).strftime("%d-%b-%Y")
+        except ValueError:
+            continue
+    try:
+        d = dateparser.parse(s, dayfirst=True)
+        return d.strftime("%d-%b-%Y")
+    except Exception:
+        return s
+
+
 def parse_date_try(s):
     if not s:
         return "NA"
     s = str(s).strip()
     if not s or s.upper() in ("NA", "-", ""):
         return "NA"
-    try:
-        d = dateparser.parse(s, dayfirst=True)
-        return d.strftime("%d-%b-%Y")
-    except Exception:
-        return s
+    return _parse_date_cached(s)
 
 
 def try_int_or(val):
@@ -122,22 +381,26 @@ def try_int_or(val):
         return val
 
 
-def should_scrape_court(court_name, selected_courts):
+def should_scrape_court(court_name, selected_courts=SELECTED_COURTS):
     """
     Check if a court should be scraped based on the selected courts configuration.
     Returns True if the court should be scraped, False otherwise.
     """
     if selected_courts is None:
         return True  # Scrape all courts
-    
-    # Check if court name matches any of the selected courts (case-insensitive, partial match)
+
+    if selected_courts is SELECTED_COURTS:
+        lowered, lowered_set = _SELECTED_LOWER, _SELECTED_SET
+    else:
+        lowered = tuple(s.lower() for s in selected_courts)
+        lowered_set = frozenset(lowered)
+
+    # exact matches short-circuit on set membership; otherwise fall back to
+    # the case-insensitive partial match in either direction
     court_name_lower = court_name.lower()
-    for selected in selected_courts:
-        selected_lower = selected.lower()
-        if selected_lower in court_name_lower or court_name_lower in selected_lower:
-            return True
-    
-    return False
+    if court_name_lower in lowered_set:
+        return True
+    return any(s in court_name_lower or court_name_lower in s for s in lowered)
 
 
 def find_major_courts_selenium(driver):
@@ -146,42 +409,35 @@ def find_major_courts_selenium(driver):
       {"name": human_readable_name, "href": absolute_href}
     We DO NOT return WebElement objects to avoid stale-element issues.
     """
-    elements = []
-    court_divs = driver.find_elements(By.CSS_SELECTOR, "div.col-md-2.mb-3")
-    for div in court_divs:
-        try:
-            anchor = div.find_element(By.CSS_SELECTOR, "a[href]")
-            href = anchor.get_attribute("href") or ""
-            # try to extract a human friendly name from the card body text
-            card_body = None
-            try:
-                card_body = div.find_element(By.CSS_SELECTOR, "div.card-body")
-                body_text = card_body.text.strip()
-            except Exception:
-                # fallback: read anchor text
-                body_text = anchor.text.strip()
-
-            # split into lines and pick the first meaningful line that's not the "Select Location..." button label
-            lines = [ln.strip() for ln in body_text.splitlines() if ln.strip()]
-            name_candidate = None
-            for ln in lines:
-                low = ln.lower()
-                if "select" in low and "location" in low:
-                    continue
-                name_candidate = ln
-                break
-            if not name_candidate:
-                # fallback to last segment of href: e.g., '/khi' -> 'khi'
-                try:
-                    parsed = urljoin(BASE_URL, href)
-                    name_candidate = parsed.rstrip("/").split("/")[-1] or parsed
-                except Exception:
-                    name_candidate = href
+    # One execute_script round-trip collects every card; the previous
+    # per-card find_element/get_attribute/.text walk cost ~4 chromedriver
+    # HTTP calls per court.
+    try:
+        elements = driver.execute_script("""
+            return Array.from(document.querySelectorAll('div.col-md-2.mb-3')).map(function (d) {
+                var a = d.querySelector('a[href]');
+                var body = d.querySelector('div.card-body');
+                var lines = ((body || a || {innerText: ''}).innerText || '')
+                    .split('\\n').map(function (s) { return s.trim(); }).filter(Boolean);
+                var name = '';
+                for (var i = 0; i < lines.length; i++) {
+                    var low = lines[i].toLowerCase();
+                    // skip the "Select Location..." button label
+                    if (low.indexOf('select') !== -1 && low.indexOf('location') !== -1) continue;
+                    name = lines[i];
+                    break;
+                }
+                return {name: name, href: a ? a.href : ''};
+            }).filter(function (m) { return m.href; });
+        """) or []
+    except Exception as e:
+        logging.warning(f"Landing-page card scan failed: {e}")
+        return []
 
-            elements.append({"name": name_candidate, "href": href})
-        except Exception:
-            # skip malformed divs
-            continue
+    for e in elements:
+        if not e["name"]:
+            # fallback to last segment of href: e.g., '/khi' -> 'khi'
+            e["name"] = e["href"].rstrip("/").split("/")[-1] or e["href"]
 
     # dedupe by href (preserve order)
     seen = set()
@@ -194,38 +450,47 @@ def find_major_courts_selenium(driver):
     return uniques
 
 
+def _cell_text(el):
+    """Whitespace-normalized text of an lxml element (spans included)."""
+    return " ".join(el.text_content().split())
+
+
 def extract_cases_from_html(html, major_name, subcourt_name=None):
     """
-    Use BeautifulSoup to parse the case table from html.
+    Parse the case table from html with lxml XPath (C-level traversal,
+    no per-cell Python callbacks).
     Returns list of case dicts and parallel list of detail link hrefs (may be None).
     """
-    soup = BeautifulSoup(html, "html.parser")
-    table = soup.find("table")
     cases = []
     detail_links = []
-    if not table:
+    try:
+        tree = lxml_html.fromstring(html)
+    except Exception:
         return [], []
+    tables = tree.xpath("//table")
+    if not tables:
+        return [], []
+    table = tables[0]
 
-    # get header texts as keys
-    header_row = table.find("thead").find("tr") if table.find("thead") else table.find("tr")
-    header_cells = [th.get_text(" ", strip=True) for th in header_row.find_all("th")]
-    rows = table.find("tbody").find_all("tr") if table.find("tbody") else table.find_all("tr")[1:]
+    # get header texts as keys (tuple computed once per page)
+    header_rows = table.xpath(".//thead/tr") or table.xpath(".//tr")
+    header_cells = tuple(_cell_text(th) for th in header_rows[0].xpath("./th"))
+    rows = table.xpath(".//tbody/tr") or table.xpath(".//tr")[1:]
     for row in rows:
-        tds = row.find_all("td")
+        tds = row.xpath("./td")
         if not tds:
             continue
-        entry = {}
-        for i, td in enumerate(tds):
-            key = header_cells[i] if i < len(header_cells) else f"col_{i}"
-            # get all text, including spans
-            val = td.get_text(" ", strip=True)
-            entry[key] = val
+        keys = header_cells
+        if len(tds) > len(keys):
+            keys = keys + tuple(f"col_{i}" for i in range(len(keys), len(tds)))
+        # C-level zip+dict instead of a per-cell Python loop
+        entry = dict(zip(keys, (_cell_text(td) for td in tds)))
         # add court and subcourt info
         entry["court"] = major_name
         entry["circuit_code"] = subcourt_name or major_name
         # find detail link in Actions column (usually last)
-        a = tds[-1].find("a", href=True) if tds else None
-        detail_links.append(a["href"] if a else None)
+        hrefs = tds[-1].xpath(".//a/@href")
+        detail_links.append(hrefs[0] if hrefs else None)
         cases.append(entry)
     return cases, detail_links
 
@@ -235,68 +500,103 @@ def extract_case_detail_from_html(html):
     Parse a case detail page (HTML) and return a details dict containing:
     profile, last_hearing, parties, advocates, documents and summary/tagline
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
 
     def pick_one(selectors):
+        # in priority order: a match with empty text falls through to the
+        # next alternative rather than returning "NA"
         for s in selectors:
             el = soup.select_one(s)
             if el and el.get_text(strip=True):
                 return el.get_text(" ", strip=True)
         return "NA"
 
-    summary = pick_one(["div#Summary", ".summary", "p.summary", ".case-summary", "#divSummary"])
-    tagline = pick_one([".tagline", "span.tagline", "p.tagline", "#Tagline"])
+    summary = pick_one(DETAIL_SELECTORS["summary"])
+    tagline = pick_one(DETAIL_SELECTORS["tagline"])
     # parties / advocates heuristics
     parties = []
     advocates = {"applicant": [], "respondent": []}
 
-    # look for tables that mention Petitioner/Respondent
-    for table in soup.find_all("table"):
-        txt = table.get_text(" ", strip=True)
-        if any(x in txt for x in ("Petitioner", "Respondent", "Appellant", "Respondent")):
-            for tr in table.find_all("tr"):
-                tds = tr.find_all("td")
-                if not tds: continue
-                line = " - ".join([td.get_text(" ", strip=True) for td in tds if td.get_text(strip=True)])
-                if line:
-                    parties.append({"name": line})
-            break
+    # look for the table that mentions Petitioner/Respondent; the soupsieve
+    # :-soup-contains selector filters tables without serializing each one's
+    # full text in Python
+    party_table = None
+    try:
+        cand = soup.select(
+            "table:-soup-contains('Petitioner'), "
+            "table:-soup-contains('Respondent'), "
+            "table:-soup-contains('Appellant')"
+        )
+        if cand:
+            party_table = cand[0]
+    except Exception:
+        party_table = None
+    if party_table is None:
+        # fallback for older soupsieve: scan table text directly
+        for table in soup.find_all("table"):
+            txt = table.get_text(" ", strip=True)
+            if any(x in txt for x in ("Petitioner", "Respondent", "Appellant")):
+                party_table = table
+                break
+    if party_table is not None:
+        for tr in party_table.find_all("tr"):
+            tds = tr.find_all("td")
+            if not tds: continue
+            line = " - ".join([td.get_text(" ", strip=True) for td in tds if td.get_text(strip=True)])
+            if line:
+                parties.append({"name": line})
 
-    # find small profile fields by label heuristics
+    # find small profile fields by label heuristics: one pass over the text
+    # nodes, matching against the precomputed lowercase label table (rather
+    # than one full-tree scan per label)
     profile = {}
-    labels = ["Case ID", "Institution Date", "Disposal Date", "Disposal Bench", "Nature Of Disposal"]
-    for lab in labels:
-        el = soup.find(string=lambda t: t and lab.lower() in t.lower())
-        if el:
-            try:
-                parent = el.parent
-                # try next sibling
-                val = parent.find_next_sibling(text=True)
-                if not val:
-                    val = parent.get_text(" ", strip=True)
-                profile[lab.lower().replace(" ", "_")] = val.strip() if val else "NA"
-            except Exception:
-                profile[lab.lower().replace(" ", "_")] = "NA"
+    wanted = dict(PROFILE_LABELS)
+    for text_node in soup.find_all(string=True):
+        if not wanted:
+            break
+        tl = text_node.strip().lower()
+        if not tl:
+            continue
+        for needle, key in list(wanted.items()):
+            if needle in tl:
+                try:
+                    parent = text_node.parent
+                    # try next sibling
+                    val = parent.find_next_sibling(string=True)
+                    if not val:
+                        val = parent.get_text(" ", strip=True)
+                    profile[key] = val.strip() if val else "NA"
+                except Exception:
+                    profile[key] = "NA"
+                del wanted[needle]
+                break
 
     # document links
     documents = {"petition_memo": "NA", "judgement_order": "NA"}
-    for a in soup.find_all("a", href=True):
+    # let the selector engine filter PDF anchors so Python only touches the
+    # handful of matches instead of every anchor on the page
+    try:
+        pdf_anchors = soup.select('a[href$=".pdf" i]')
+    except Exception:
+        # fallback for soupsieve without case-insensitive attribute flags
+        pdf_anchors = [a for a in soup.find_all("a", href=True)
+                       if a["href"].lower().endswith(".pdf")]
+    for a in pdf_anchors:
         href = a["href"]
         txt = a.get_text(" ", strip=True).lower()
-        if href.lower().endswith(".pdf"):
-            if "memo" in txt or "petition" in txt:
-                documents["petition_memo"] = urljoin(BASE_URL, href)
-            elif "judgement" in txt or "judgment" in txt or "order" in txt:
-                documents["judgement_order"] = urljoin(BASE_URL, href)
+        if any(k in txt for k in PDF_MEMO_KEYS):
+            documents["petition_memo"] = absolutize(href)
+        elif any(k in txt for k in PDF_ORDER_KEYS):
+            documents["judgement_order"] = absolutize(href)
 
     details_obj = {
         "profile": profile or {},
         "last_hearing": {
-            "date": pick_one([".last-hearing .date", ".last-hearing", ".hearing-date", "li.hearing-date"]),
-            "list": pick_one([".last-hearing .list", ".hearing-list"]),
-            "stage": pick_one([".last-hearing .stage", ".hearing-stage"]),
-            "bench": pick_one([".last-hearing .bench", ".hearing-bench"]),
-            "remarks": pick_one([".last-hearing .remarks", ".remarks"])
+            "date": pick_one(DETAIL_SELECTORS["hearing_date"]),
+            "list": pick_one(DETAIL_SELECTORS["hearing_list"]),
+            "stage": pick_one(DETAIL_SELECTORS["hearing_stage"]),
+            "bench": pick_one(DETAIL_SELECTORS["hearing_bench"]),
+            "remarks": pick_one(DETAIL_SELECTORS["hearing_remarks"])
         },
         "parties": parties,
         "advocates": advocates,
@@ -306,106 +606,278 @@ def extract_case_detail_from_html(html):
     return {"summary": summary, "tagline": tagline if tagline != "NA" else "NA", "details": details_obj}
 
 
-def handle_pagination_and_scrape(driver, major_name, sub_text, sr_no):
+class CaseFileWriter:
+    """
+    Stream a court's output file as {"metadata": ..., "cases": [...]} one
+    case at a time, so peak memory stays bounded by a single page of cases
+    instead of the whole court. The closing "]}" is only written by
+    close(), so callers must close() in a finally block for failed scrapes
+    to leave valid JSON behind.
+
+    Thread-safe: concurrent subcourt workers share one writer, which also
+    assigns each case its sr_no (the position in the file).
+    """
+
+    def __init__(self, path, metadata):
+        self.path = path
+        self.count = 0
+        self._lock = threading.Lock()
+        self._f = open(path, "w", encoding="utf-8")
+        self._f.write('{\n"metadata": ')
+        self._f.write(dumps_pretty(metadata))
+        self._f.write(',\n"cases": [')
+
+    def write_case(self, case):
+        with self._lock:
+            self.count += 1
+            case["sr_no"] = self.count
+            self._f.write(",\n" if self.count > 1 else "\n")
+            self._f.write(dumps_pretty(case))
+
+    def close(self):
+        self._f.write("\n]\n}\n" if self.count else "]\n}\n")
+        self._f.close()
+
+
+def dumps_pretty(obj):
+    """Serialize obj to an indented JSON string; orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def sync_cookies_to_session(driver, session):
     """
-    Handle pagination for a specific subcourt and scrape all pages.
-    Returns list of all cases and updated sr_no counter.
+    Copy the browser's cookies into `session` so plain-HTTP fetches
+    (detail pages, pagination) share the Selenium-established session.
+    """
+    try:
+        for c in driver.get_cookies():
+            session.cookies.set(c["name"], c["value"], domain=c.get("domain"))
+    except Exception as e:
+        logging.debug(f"Could not sync cookies to requests session: {e}")
+
+
+def find_next_page_href(html):
+    """
+    Locate the enabled 'next' pagination link in a result-page HTML.
+    Returns the (possibly relative) href, or None when on the last page.
+    """
+    soup = BeautifulSoup(html, "lxml")
+    next_li = soup.select_one("li.next:not(.disabled)")
+    if not next_li:
+        return None
+    a = next_li.find("a", href=True)
+    return a["href"] if a else None
+
+
+def _detail_looks_empty(detail_data):
     """
-    all_cases = []
+    Heuristic: True if a parsed detail page carries no usable content
+    (likely a JS-rendered page that plain HTTP could not capture).
+    """
+    d = detail_data.get("details", {})
+    return (
+        detail_data.get("summary") == "NA"
+        and detail_data.get("tagline") == "NA"
+        and not d.get("profile")
+        and not d.get("parties")
+        and all(v == "NA" for v in d.get("documents", {}).values())
+    )
+
+
+def cached_fetch(url, session):
+    """
+    Fetch a detail page, caching the raw HTML on disk keyed by URL hash.
+    Reruns after a crash skip the network entirely for already-seen cases.
+    """
+    h = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, h[:2], h)
+    if os.path.exists(cache_path):
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return f.read()
+    resp = session.get(url, timeout=15, verify=REQUESTS_VERIFY)
+    # never cache error bodies: a cached 404/500 would replay on every rerun
+    resp.raise_for_status()
+    html = resp.text
+    cache_dir = os.path.dirname(cache_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    # write-then-rename so a crash mid-write never leaves a truncated entry
+    # that later reruns would silently treat as the full page
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(html)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return html
+
+
+def fetch_and_parse(url, session):
+    """
+    Fetch a case detail page over the worker's requests session and parse
+    it. Returns the detail dict, or None if the fetch failed or the page
+    looks JS-rendered/empty (caller may fall back to a Selenium tab).
+    """
+    try:
+        html = cached_fetch(url, session)
+        detail_data = extract_case_detail_from_html(html)
+        if _detail_looks_empty(detail_data):
+            return None
+        return detail_data
+    except Exception as e:
+        logging.debug(f"requests detail fetch failed for {url}: {e}")
+        return None
+
+
+def handle_pagination_and_scrape(driver, major_name, sub_text, writer, session,
+                                 initial_html=None, driver_lock=None):
+    """
+    Handle pagination for a specific subcourt and scrape all pages,
+    streaming each case to `writer` as it is produced (the writer assigns
+    sr_no). Past the first page everything runs over requests, so several
+    subcourts can run this concurrently against one driver as long as they
+    share `driver_lock` for the rare Selenium fallbacks.
+    Returns the number of cases written.
+    """
+    n_cases = 0
     current_page = 1
-    
+    prev_page_sig = None
+    lock = driver_lock if driver_lock is not None else threading.Lock()
+
+    # share the Selenium session with `session` for pagination/detail GETs
+    with lock:
+        sync_cookies_to_session(driver, session)
+
+    # page_html holds the HTML of the page being processed; when the caller
+    # did not capture it (no-subcourt path), read it from the browser.
+    page_html = initial_html
+    if page_html is None:
+        with lock:
+            try:
+                WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "table")))
+                page_html = driver.page_source
+            except TimeoutException:
+                pass
+
     while current_page <= MAX_PAGES:
         logging.info(f"  Processing page {current_page} for subcourt {sub_text}")
-        
-        # Wait for table to load
-        try:
-            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "table")))
-        except TimeoutException:
+
+        if page_html is None:
             logging.info(f"  No table found on page {current_page}, stopping pagination")
             break
-        
+
         # Extract cases from current page
-        html = driver.page_source
-        cases_page, detail_links = extract_cases_from_html(html, major_name, sub_text)
+        cases_page, detail_links = extract_cases_from_html(page_html, major_name, sub_text)
         
         if not cases_page:
             logging.info(f"  No cases found on page {current_page}, stopping pagination")
             break
-        
+
+        # Progress check: some servers answer out-of-range page= params by
+        # re-serving the last page, which would duplicate every case up to
+        # MAX_PAGES times. Compare against the previous page (signature is
+        # taken before the rows are mutated with details below).
+        page_sig = (len(cases_page), tuple(cases_page[0].values()))
+        if page_sig == prev_page_sig:
+            logging.info(f"  Page {current_page} repeats the previous page, stopping pagination")
+            break
+        prev_page_sig = page_sig
+
         logging.info(f"  Found {len(cases_page)} cases on page {current_page}")
         
-        # Process each case on this page
-        for i, c in enumerate(cases_page):
-            # Fetch details if link exists
+        # Resolve absolute detail URLs (index-aligned with cases_page)
+        full_urls = []
+        for i in range(len(cases_page)):
             detail_href = detail_links[i] if i < len(detail_links) else None
             if detail_href:
-                full = detail_href if detail_href.startswith("http") else urljoin(BASE_URL, detail_href)
-                # Open in new tab
-                driver.execute_script("window.open('');")
-                driver.switch_to.window(driver.window_handles[-1])
-                try:
-                    driver.get(full)
-                    time.sleep(0.8)
-                    detail_data = extract_case_detail_from_html(driver.page_source)
-                    c["tagline"] = detail_data.get("tagline", c.get("tagline", "NA"))
-                    c["details"] = detail_data["details"]
-                    c["details"].setdefault("summary", detail_data.get("summary", "NA"))
-                except Exception as e:
-                    logging.debug(f"Failed to fetch detail {full}: {e}")
-                finally:
-                    driver.close()
-                    driver.switch_to.window(driver.window_handles[0])
+                full_urls.append(detail_href if detail_href.startswith("http") else urljoin(BASE_URL, detail_href))
+            else:
+                full_urls.append(None)
+
+        # Detail pages are static HTML, so fetch them concurrently over plain
+        # HTTP instead of opening a Selenium tab per case (chromedriver
+        # round-trips dominate runtime otherwise).
+        details_by_idx = {}
+        to_fetch = {i: u for i, u in enumerate(full_urls) if u}
+        if to_fetch:
+            with ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as executor:
+                futures = {i: executor.submit(fetch_and_parse, u, session) for i, u in to_fetch.items()}
+                for i, fut in futures.items():
+                    details_by_idx[i] = fut.result()
+
+        # Process each case on this page
+        for i, c in enumerate(cases_page):
+            full = full_urls[i]
+            detail_data = details_by_idx.get(i)
+            if full and detail_data is None:
+                # requests GET came back empty (likely JS-rendered detail);
+                # fall back to the Selenium tab path for this case only
+                with lock:
+                    driver.execute_script("window.open('');")
+                    driver.switch_to.window(driver.window_handles[-1])
+                    try:
+                        driver.get(full)
+                        WebDriverWait(driver, 8).until(
+                            EC.presence_of_element_located((By.CSS_SELECTOR, "body"))
+                        )
+                        wait_document_ready(driver, 8)
+                        detail_data = extract_case_detail_from_html(driver.page_source)
+                    except Exception as e:
+                        logging.debug(f"Failed to fetch detail {full}: {e}")
+                        detail_data = None
+                    finally:
+                        driver.close()
+                        driver.switch_to.window(driver.window_handles[0])
+
+            if detail_data:
+                c["tagline"] = detail_data.get("tagline", c.get("tagline", "NA"))
+                c["details"] = detail_data["details"]
+                c["details"].setdefault("summary", detail_data.get("summary", "NA"))
             else:
                 c["details"] = {"profile": {}, "last_hearing": {}, "parties": [], "advocates": {}, "documents": {}}
 
-            c["sr_no"] = sr_no
-            sr_no += 1
-            all_cases.append(c)
+            writer.write_case(c)  # writer assigns sr_no
+            n_cases += 1
         
-        # Try to find and click next page
+        # Try to find and fetch the next page. The pagination link is a plain
+        # GET (page= query param), so fetch it over requests and only fall
+        # back to a Selenium navigation if that fails.
         next_found = False
         if current_page < MAX_PAGES:
             try:
-                logging.info(f"  Looking for next page button on page {current_page}")
-                
-                # Wait a bit for any AJAX to complete
-                time.sleep(1)
-                
-                # Look specifically for the next button with class "next"
-                next_li = driver.find_element(By.CSS_SELECTOR, "li.next:not(.disabled)")
-                next_button = next_li.find_element(By.CSS_SELECTOR, "a[data-page]")
-                
-                if next_button:
-                    # Get the href attribute
-                    href = next_button.get_attribute('href')
-                    data_page = next_button.get_attribute('data-page')
-                    
-                    logging.info(f"  Found next button with data-page: {data_page}")
-                    
-                    if href:
-                        # Navigate directly using the href
-                        logging.info(f"  Navigating to: {href}")
-                        driver.get(href)
-                        
-                        # Wait for the new page to load
-                        time.sleep(2)
-                        
-                        # Verify we're on a new page by checking if page parameter changed
-                        current_url = driver.current_url
-                        if f"page={current_page + 1}" in current_url or f"data-page=\"{current_page}\"" in driver.page_source:
-                            next_found = True
-                            current_page += 1
-                            logging.info(f"  Successfully moved to page {current_page}")
-                        else:
-                            logging.info(f"  URL didn't change as expected, stopping pagination")
-                            break
-                    else:
-                        logging.info(f"  Next button found but no href, stopping pagination")
-                        break
-                        
-            except NoSuchElementException:
-                logging.info(f"  No next button found on page {current_page}, stopping pagination")
-                break
+                next_href = find_next_page_href(page_html)
+                if next_href:
+                    next_url = absolutize(next_href)
+                    logging.info(f"  Fetching next page: {next_url}")
+                    page_html = None
+                    try:
+                        resp = session.get(next_url, timeout=15, verify=REQUESTS_VERIFY)
+                        if "<table" in resp.text.lower():
+                            page_html = resp.text
+                    except Exception as e:
+                        logging.debug(f"  requests pagination fetch failed: {e}")
+                    if page_html is None:
+                        # JS-driven pagination; navigate the browser instead
+                        with lock:
+                            driver.get(next_url)
+                            try:
+                                WebDriverWait(driver, 10).until(
+                                    EC.presence_of_element_located((By.TAG_NAME, "table"))
+                                )
+                                page_html = driver.page_source
+                            except TimeoutException:
+                                pass
+                    next_found = True
+                    current_page += 1
+                else:
+                    logging.info(f"  No next button found on page {current_page}, stopping pagination")
+                    break
             except Exception as e:
                 logging.error(f"  Error during pagination: {e}")
                 break
@@ -414,20 +886,29 @@ def handle_pagination_and_scrape(driver, major_name, sub_text, sr_no):
             logging.info(f"  Reached end of pagination or max pages for subcourt {sub_text}")
             break
     
-    logging.info(f"  Completed pagination for subcourt {sub_text}. Total pages processed: {current_page}, Total cases: {len(all_cases)}")
-    return all_cases, sr_no
+    logging.info(f"  Completed pagination for subcourt {sub_text}. Total pages processed: {current_page}, Total cases: {n_cases}")
+    return n_cases
 
 
 def scrape_major_court(driver, major):
     """
     major: {"name": str, "href": str}
-    Returns metadata, all_cases
+    Streams cases to OUTPUT_DIR/<file_name> as they are scraped and
+    returns (metadata, case_count).
     This version NAVIGATES using major['href'] (no WebElement usage).
     """
     major_name = major.get("name")
     href = major.get("href")
     logging.info(f"Processing major court: {major_name}  (href={href})")
 
+    metadata = {
+        "file_name": f"SindhCourt_{sanitize_filename(major_name)}.json",
+        "created_on": datetime.utcnow().strftime("%Y-%m-%d"),
+        "source": "Sindh High Court Case Search Portal",
+        "url": BASE_URL,
+        "description": f"Cases extracted for major court: {major_name}"
+    }
+
     # navigate to the court page using the saved href
     try:
         if href:
@@ -442,16 +923,14 @@ def scrape_major_court(driver, major):
             driver.execute_script("arguments[0].click();", el)
     except Exception as e:
         logging.warning(f"Could not navigate to major court page for {major_name}: {e}")
-        return {
-            "file_name": f"SindhCourt_{sanitize_filename(major_name)}.json",
-            "created_on": datetime.utcnow().strftime("%Y-%m-%d"),
-            "source": "Sindh High Court Case Search Portal",
-            "url": href or BASE_URL,
-            "description": f"Failed to open major court: {e}"
-        }, []
+        metadata["url"] = href or BASE_URL
+        metadata["description"] = f"Failed to open major court: {e}"
+        writer = CaseFileWriter(os.path.join(OUTPUT_DIR, metadata["file_name"]), metadata)
+        writer.close()
+        return metadata, 0
 
-    # let the page JS load a bit
-    time.sleep(1.0)
+    # let the page JS finish initializing
+    wait_document_ready(driver)
 
     # Always click the search/submit button to load cases table
     try:
@@ -459,113 +938,141 @@ def scrape_major_court(driver, major):
             EC.element_to_be_clickable((By.CSS_SELECTOR, "button[type='submit'].btn-success"))
         )
         driver.execute_script("arguments[0].click();", search_btn)
-        time.sleep(1.0)
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody tr"))
+            )
+        except TimeoutException:
+            logging.debug("No result rows appeared after search click.")
     except Exception as e:
         logging.warning(f"Could not find or click search button for {major_name}: {e}")
 
-    # try find the subcourt select
-    sub_select = None
-    try:
-        # common id on site is 'ddlCourt' but allow fallback
-        try:
-            sub_select = Select(driver.find_element(By.ID, "ddlCourt"))
-        except Exception:
-            # first <select> element fallback
-            sel_el = driver.find_element(By.TAG_NAME, "select")
-            sub_select = Select(sel_el)
-    except Exception:
+    # try find the subcourt select; probe with find_elements (returns []
+    # immediately) rather than paying an exception per missing element.
+    # Common id on site is 'ddlCourt', first <select> is the fallback.
+    sel_els = driver.find_elements(By.ID, "ddlCourt") or driver.find_elements(By.TAG_NAME, "select")
+    if sel_els:
+        sub_select = Select(sel_els[0])
+    else:
         logging.info("No subcourt select found; will attempt to parse page table directly.")
         sub_select = None
 
-    all_cases = []
-    sr_no = 1
-
-    subcourt_texts = []
-    if sub_select:
-        opts = sub_select.options
-        for o in opts:
-            txt = o.text.strip()
-            val = o.get_attribute("value")
-            if txt and "Select" not in txt:
-                subcourt_texts.append((txt, val))
-
-    if not subcourt_texts:
-        # try to parse cases on the page directly (no dropdown)
-        logging.info("No subcourts found, processing main court page with pagination")
-        cases, sr_no = handle_pagination_and_scrape(driver, major_name, None, sr_no)
-        all_cases.extend(cases)
-    else:
-        # iterate subcourts
-        for sub_text, sub_val in subcourt_texts:
-            logging.info(f" Processing subcourt: {sub_text} (value={sub_val})")
-            # select the option
-            try:
-                # re-find the select element (select object may become stale)
-                try:
-                    sub_select = Select(driver.find_element(By.ID, "ddlCourt"))
-                except Exception:
-                    sel_el = driver.find_element(By.TAG_NAME, "select")
-                    sub_select = Select(sel_el)
-                sub_select.select_by_visible_text(sub_text)
-                time.sleep(0.6)
-            except Exception:
-                # try selecting by value
-                try:
-                    sub_select.select_by_value(sub_val)
-                    time.sleep(0.6)
-                except Exception:
-                    logging.warning(f"Couldn't select subcourt {sub_text}; skipping.")
-                    continue
+    # stream cases to disk as they are produced instead of accumulating
+    # the whole court in memory; this court's HTTP fetches share one session
+    # so its driver's cookies never mix with another court's
+    writer = CaseFileWriter(os.path.join(OUTPUT_DIR, metadata["file_name"]), metadata)
+    session = make_session()
 
-            # find and click Search button
-            search_btn = None
-            try:
-                # common id
-                try:
-                    search_btn = driver.find_element(By.ID, "btnSearch")
-                except Exception:
-                    # try button with Search text
-                    search_btn = driver.find_element(By.XPATH, "//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'search')]")
-            except Exception:
-                search_btn = None
+    try:
+        subcourt_texts = []
+        if sub_select:
+            opts = sub_select.options
+            for o in opts:
+                txt = o.text.strip()
+                val = o.get_attribute("value")
+                if txt and "Select" not in txt:
+                    subcourt_texts.append((txt, val))
 
-            if search_btn:
+        if not subcourt_texts:
+            # try to parse cases on the page directly (no dropdown)
+            logging.info("No subcourts found, processing main court page with pagination")
+            handle_pagination_and_scrape(driver, major_name, None, writer, session)
+        else:
+            # Phase 1 (serial): drive the shared dropdown/search form for each
+            # subcourt and capture its first result page. This part must stay
+            # sequential because all subcourts share one form on one page.
+            first_pages = []  # (sub_text, first_page_html or None)
+            for sub_text, sub_val in subcourt_texts:
+                logging.info(f" Processing subcourt: {sub_text} (value={sub_val})")
+                # remember what is currently rendered so we can tell when this
+                # subcourt's results actually replace it
+                old_first = first_result_row_text(driver)
+                # select the option
                 try:
-                    driver.execute_script("arguments[0].click();", search_btn)
+                    # re-find the select element (select object may become stale)
+                    sel_els = driver.find_elements(By.ID, "ddlCourt") or driver.find_elements(By.TAG_NAME, "select")
+                    if sel_els:
+                        sub_select = Select(sel_els[0])
+                    sub_select.select_by_visible_text(sub_text)
+                    wait_ajax_settled(driver)
                 except Exception:
+                    # try selecting by value
                     try:
-                        search_btn.click()
+                        sub_select.select_by_value(sub_val)
+                        wait_ajax_settled(driver)
                     except Exception:
-                        logging.debug("Search click failed; proceeding to scrape page.")
-                # wait for table to appear (or small wait)
-                try:
-                    WebDriverWait(driver, 8).until(EC.presence_of_element_located((By.TAG_NAME, "table")))
-                except TimeoutException:
-                    logging.debug("Table not present after search; maybe results loaded by different means.")
-            else:
-                logging.debug("Search button not found; trying to parse page as-is.")
+                        logging.warning(f"Couldn't select subcourt {sub_text}; skipping.")
+                        continue
 
-            # Handle pagination for this subcourt
-            cases, sr_no = handle_pagination_and_scrape(driver, major_name, sub_text, sr_no)
-            all_cases.extend(cases)
+                # find and click Search button: common id first, then any button
+                # with Search text; find_elements keeps both probes instant
+                btns = driver.find_elements(By.ID, "btnSearch") or driver.find_elements(
+                    By.XPATH, "//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'search')]")
+                search_btn = btns[0] if btns else None
 
-    metadata = {
-        "file_name": f"SindhCourt_{sanitize_filename(major_name)}.json",
-        "created_on": datetime.utcnow().strftime("%Y-%m-%d"),
-        "source": "Sindh High Court Case Search Portal",
-        "url": BASE_URL,
-        "description": f"Cases extracted for major court: {major_name}"
-    }
-    return metadata, all_cases
+                if search_btn:
+                    try:
+                        driver.execute_script("arguments[0].click();", search_btn)
+                    except Exception:
+                        try:
+                            search_btn.click()
+                        except Exception:
+                            logging.debug("Search click failed; proceeding to scrape page.")
+                    # wait for the results to visibly change — the previous
+                    # subcourt's table satisfies a bare presence wait and would
+                    # be captured (and paginated) as this subcourt's data
+                    if not wait_results_changed(driver, old_first, 10):
+                        logging.debug("Result rows did not change after search; capturing current page as-is.")
+                else:
+                    logging.debug("Search button not found; trying to parse page as-is.")
+
+                first_pages.append((sub_text, driver.page_source))
+
+            # Phase 2 (parallel): pagination and detail fetching run over
+            # requests past the captured first page, so subcourts proceed
+            # concurrently, sharing the driver behind a lock for the rare
+            # Selenium fallbacks. first_pages is empty when every subcourt
+            # selection failed; the court file then stays empty as before.
+            if not first_pages:
+                logging.warning(f"No subcourt pages captured for {major_name}; nothing to scrape.")
+            driver_lock = threading.Lock()
+            with ThreadPoolExecutor(max_workers=max(1, min(SUBCOURT_WORKERS, len(first_pages)))) as executor:
+                futures = [
+                    executor.submit(handle_pagination_and_scrape, driver, major_name,
+                                    sub_text, writer, session, first_html, driver_lock)
+                    for sub_text, first_html in first_pages
+                ]
+                for fut in futures:
+                    fut.result()
+
+    finally:
+        writer.close()
+    return metadata, writer.count
+
+
+# no + quantifier: each unsafe character maps to one "_" (existing output
+# files encode e.g. "CIRCUITCODE__13"). Unlike the original isalnum() loop
+# this keeps only ASCII alphanumerics; that is deliberate — the portal's
+# court names are ASCII, and a non-ASCII name would merely over-sanitize
+# to more underscores, never collide with an established filename.
+_UNSAFE_RE = re.compile(r"[^A-Za-z0-9 _-]")
 
 
 def sanitize_filename(s):
-    safe = "".join([c if c.isalnum() or c in (" ", "_", "-") else "_" for c in s])
-    return safe.replace(" ", "_")
+    return _UNSAFE_RE.sub("_", s).replace(" ", "_")
 
 
 def main():
-    driver = start_driver(headless=HEADLESS)
+    driver = attach_driver() if REUSE_DRIVER_SESSION else None
+    if driver is None:
+        driver = start_driver(headless=HEADLESS)
+        if REUSE_DRIVER_SESSION:
+            save_driver_session(driver)
+    # the attached/saved driver survives the run so the next one can reuse
+    # it; its profile/cache dirs must survive with it
+    persistent_driver = driver if REUSE_DRIVER_SESSION else None
+    if persistent_driver is not None:
+        _PERSISTENT_PROFILE_DIRS.update(getattr(persistent_driver, "_temp_dirs", ()))
     try:
         driver.get(BASE_URL)
     except Exception as e:
@@ -573,7 +1080,13 @@ def main():
         driver.quit()
         return
 
-    time.sleep(1.0)  # let JS initialize
+    # wait for the landing page court cards rather than sleeping blindly
+    try:
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "div.col-md-2.mb-3"))
+        )
+    except TimeoutException:
+        logging.warning("Court cards did not appear on landing page within timeout.")
     majors = find_major_courts_selenium(driver)
     logging.info(f"Found major courts: {[m['name'] for m in majors]}")
     
@@ -590,26 +1103,40 @@ def main():
     else:
         logging.info("Scraping all courts (no filter applied)")
 
-    for major in majors:
-        logging.info(f"Starting scrape for: {major['name']} (href={major['href']})")
-        # Always navigate fresh via href (no stale element references)
-        meta, cases = scrape_major_court(driver, major)
-        # If scrape_major_court returned None as part of the placeholder, your function should proceed to fill meta/cases.
-        if meta is None and cases is None:
-            # if you used the placeholder return in the patch above, proceed to call the original scraping body:
-            # In your file the rest of scrape_major_court follows navigation; ensure it executes and returns meta,cases
-            logging.warning("scrape_major_court returned placeholder; ensure combined function continues after navigation.")
-            # Fallback: skip writing
-            continue
+    # Pool of pre-warmed drivers: major courts are independent, so dispatch
+    # them to concurrent workers, each borrowing a driver from the queue.
+    n_workers = min(DRIVER_POOL_SIZE, max(1, len(majors)))
+    driver_pool = queue.Queue()
+    driver_pool.put(driver)  # reuse the discovery driver as the first worker
+    for _ in range(n_workers - 1):
+        driver_pool.put(start_driver(headless=HEADLESS))
 
-        out = {"metadata": meta, "cases": cases}
-        outfname = os.path.join(OUTPUT_DIR, meta["file_name"])
-        # incremental save for safety
-        with open(outfname, "w", encoding="utf-8") as f:
-            json.dump(out, f, ensure_ascii=False, indent=2)
-        logging.info(f"Wrote {len(cases)} case entries to {outfname}")
+    def work(major):
+        logging.info(f"Starting scrape for: {major['name']} (href={major['href']})")
+        d = driver_pool.get()
+        try:
+            # Always navigate fresh via href (no stale element references)
+            return scrape_major_court(d, major)
+        finally:
+            driver_pool.put(d)
 
-    driver.quit()
+    try:
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            # scrape_major_court streams each court's file itself; just log
+            for meta, count in executor.map(work, majors):
+                if meta is None:
+                    logging.warning("scrape_major_court returned no metadata.")
+                    continue
+                logging.info(f"Wrote {count} case entries to {os.path.join(OUTPUT_DIR, meta['file_name'])}")
+    finally:
+        while not driver_pool.empty():
+            try:
+                d = driver_pool.get_nowait()
+                if d is persistent_driver:
+                    continue
+                d.quit()
+            except Exception:
+                pass
     logging.info("All done.")
 
 